@@ -40,6 +40,8 @@ from .kaalition_lib import (
     DEFAULT_USER_AGENT,
     DEFAULT_EMAIL_DOMAINS,
     DEFAULT_SITE_KEY,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_CACHE_TTL,
 )
 
 __version__ = "3.1.1"
@@ -85,4 +87,6 @@ __all__ = [
     "DEFAULT_USER_AGENT",
     "DEFAULT_EMAIL_DOMAINS",
     "DEFAULT_SITE_KEY",
+    "DEFAULT_POOL_SIZE",
+    "DEFAULT_CACHE_TTL",
 ]
\ No newline at end of file
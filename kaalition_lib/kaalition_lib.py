@@ -69,11 +69,20 @@ Kaalition.ru API Library
 
 import requests
 import re
-import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from operator import attrgetter
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
-from faker import Faker
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson — необязательная зависимость
+    from json import loads as _json_loads
 
 # ============================================================================
 # КОНСТАНТЫ
@@ -87,6 +96,11 @@ DEFAULT_USER_AGENT = (
 )
 DEFAULT_EMAIL_DOMAINS = ["gmail.com", "outlook.com", "ya.ru", "hotmail.com"]
 DEFAULT_SITE_KEY = "ZPCuKEjG9nT1o890yvmrJAkxvRWmLO0vXylIt92he6imCqAS"
+DEFAULT_POOL_SIZE = 32
+DEFAULT_CACHE_TTL = 60
+
+# slots=True у dataclass доступен начиная с Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 # ============================================================================
@@ -172,7 +186,7 @@ class ChannelMemberError(ChannelError):
 # DATACLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class User:
     """Датакласс для пользователя."""
     id: int
@@ -185,14 +199,15 @@ class User:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "User":
+        g = data.get
         return cls(
-            id=data.get("id", 0),
-            username=data.get("username", ""),
-            nickname=data.get("nickname", ""),
-            photo=data.get("photo", "") or "",
-            avatar_emoji=data.get("avatar_emoji"),
-            is_verified=data.get("is_verified", False),
-            is_admin=data.get("is_admin", False)
+            id=g("id", 0),
+            username=g("username", ""),
+            nickname=g("nickname", ""),
+            photo=g("photo", "") or "",
+            avatar_emoji=g("avatar_emoji"),
+            is_verified=g("is_verified", False),
+            is_admin=g("is_admin", False)
         )
 
     def __str__(self) -> str:
@@ -204,7 +219,7 @@ class User:
         return self.__str__()
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Reaction:
     """Датакласс для реакции на сообщение."""
     emoji: str
@@ -213,14 +228,15 @@ class Reaction:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Reaction":
+        g = data.get
         return cls(
-            emoji=data.get("emoji", ""),
-            count=data.get("count", 0),
-            user_ids=data.get("user_ids", [])
+            emoji=g("emoji", ""),
+            count=g("count", 0),
+            user_ids=g("user_ids", [])
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Message:
     """Датакласс для личного сообщения."""
     id: int
@@ -239,8 +255,8 @@ class Message:
     @classmethod
     def from_dict(cls, data: Dict[str, Any], sender: User, receiver: User,
                   account: Optional["Account"] = None) -> "Message":
-        reactions = [Reaction.from_dict(r) for r in data.get("reactions", [])] if isinstance(data.get("reactions"),
-                                                                                             list) else []
+        reactions_data = data.get("reactions")
+        reactions = list(map(Reaction.from_dict, reactions_data)) if type(reactions_data) is list else []
         return cls(
             id=data.get("id", 0),
             sender=sender,
@@ -301,7 +317,7 @@ class Message:
         return self.account.toggle_message_reaction(self, emoji)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Chat:
     """Датакласс для списка чатов (диалогов)."""
     id: int = field(init=False)
@@ -346,7 +362,7 @@ class Chat:
 
 # Обновлённый класс Channel
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Channel:
     """Датакласс для канала."""
     id: int
@@ -425,7 +441,7 @@ class Channel:
 
 # Обновлённый класс ChannelMessage
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ChannelMessage:
     """Датакласс для поста/сообщения в канале."""
     id: int
@@ -459,8 +475,8 @@ class ChannelMessage:
             author = User(id=data.get("user_id", 0) or data.get("author_id", 0), username="", nickname="")
 
         # Реакции
-        reactions = [Reaction.from_dict(r) for r in data.get("reactions", [])] if isinstance(data.get("reactions"),
-                                                                                             list) else []
+        reactions_data = data.get("reactions")
+        reactions = list(map(Reaction.from_dict, reactions_data)) if type(reactions_data) is list else []
 
         return cls(
             id=data.get("id", 0),
@@ -532,7 +548,7 @@ class ChannelMessage:
         return self.account.get_channel_message_comments(self.channel_id, self.id)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ChannelMember:
     """Датакласс для участника канала."""
     user: User
@@ -554,7 +570,7 @@ class ChannelMember:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Project:
     """Датакласс для проекта."""
     id: int
@@ -570,21 +586,22 @@ class Project:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Project":
+        g = data.get
         return cls(
-            id=data.get("id", 0),
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            image=data.get("image"),
-            button_text=data.get("button_text", ""),
-            link=data.get("link", ""),
-            order=data.get("order", 0),
-            is_active=data.get("is_active", True),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", "")
+            id=g("id", 0),
+            title=g("title", ""),
+            description=g("description", ""),
+            image=g("image"),
+            button_text=g("button_text", ""),
+            link=g("link", ""),
+            order=g("order", 0),
+            is_active=g("is_active", True),
+            created_at=g("created_at", ""),
+            updated_at=g("updated_at", "")
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Member:
     """Датакласс для участника."""
     id: int
@@ -600,21 +617,22 @@ class Member:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Member":
+        g = data.get
         return cls(
-            id=data.get("id", 0),
-            nickname=data.get("nickname", ""),
-            photo=data.get("photo"),
-            group=data.get("group", ""),
-            telegram=data.get("telegram", ""),
-            itd=data.get("itd", ""),
-            order=data.get("order", 0),
-            is_active=data.get("is_active", True),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", "")
+            id=g("id", 0),
+            nickname=g("nickname", ""),
+            photo=g("photo"),
+            group=g("group", ""),
+            telegram=g("telegram", ""),
+            itd=g("itd", ""),
+            order=g("order", 0),
+            is_active=g("is_active", True),
+            created_at=g("created_at", ""),
+            updated_at=g("updated_at", "")
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class News:
     """Датакласс для новости."""
     id: int
@@ -629,16 +647,17 @@ class News:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "News":
+        g = data.get
         return cls(
-            id=data.get("id", 0),
-            title=data.get("title", ""),
-            content=data.get("content", ""),
-            subtitle=data.get("subtitle"),
-            image=data.get("image"),
-            is_published=data.get("is_published", True),
-            views=data.get("views", 0),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", "")
+            id=g("id", 0),
+            title=g("title", ""),
+            content=g("content", ""),
+            subtitle=g("subtitle"),
+            image=g("image"),
+            is_published=g("is_published", True),
+            views=g("views", 0),
+            created_at=g("created_at", ""),
+            updated_at=g("updated_at", "")
         )
 
 
@@ -646,26 +665,65 @@ class News:
 # УТИЛИТЫ
 # ============================================================================
 
+_WAIT_RE = re.compile(
+    r'подожди(?:те)?\s*(\d+)'
+    r'|wait\s*(\d+)'
+    r'|retry_after["\']?\s*:\s*(\d+)'
+    r'|timeout["\']?\s*:\s*(\d+)'
+    r'|(\d+)\s*секунд',
+    re.IGNORECASE
+)
+
+
 def parse_wait_time(response_text: str) -> Optional[int]:
     """Извлекает время ожидания из ответа сервера."""
-    patterns = [
-        r'подожди(?:те)?\s*(\d+)',
-        r'wait\s*(\d+)',
-        r'retry_after["\']?\s*:\s*(\d+)',
-        r'timeout["\']?\s*:\s*(\d+)',
-        r'(\d+)\s*секунд',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, response_text, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
+    match = _WAIT_RE.search(response_text)
+    if match:
+        # В каждой альтернативе ровно одна группа — lastindex указывает на сработавшую
+        return int(match.group(match.lastindex))
     return None
 
 
+def _json(response: requests.Response) -> Any:
+    """Декодирует JSON из тела ответа (через orjson, если установлен)."""
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.RequestException(f"Некорректный JSON: {e}", response=response) from e
+
+
 # ============================================================================
 # KAALITION CLIENT
 # ============================================================================
 
+class _SharedPoolAdapter(HTTPAdapter):
+    """HTTPAdapter с общим на процесс пулом соединений.
+
+    Session.close() вызывает close() у адаптеров — общий пул при этом не очищается,
+    иначе закрытие одной сессии обрывало бы keep-alive соединения всех клиентов.
+    """
+
+    def close(self):
+        pass
+
+
+# Пул keep-alive соединений и повтор запросов при 502/503/504.
+# Один на процесс: короткоживущие клиенты и аккаунты переиспользуют TCP/TLS-соединения.
+# Retry-After не соблюдается: urllib3 ждёт его без ограничения и вне timeout запроса,
+# а о времени ожидания вызывающий код узнаёт через parse_wait_time().
+_ADAPTER = _SharedPoolAdapter(
+    pool_connections=DEFAULT_POOL_SIZE,
+    pool_maxsize=DEFAULT_POOL_SIZE,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+        respect_retry_after_header=False
+    )
+)
+
+
 class KaalitionClient:
     """Клиент для работы с публичными данными API kaalition.ru."""
 
@@ -673,10 +731,12 @@ class KaalitionClient:
             self,
             base_url: str = DEFAULT_BASE_URL,
             user_agent: str = DEFAULT_USER_AGENT,
-            site_key: str = DEFAULT_SITE_KEY
+            site_key: str = DEFAULT_SITE_KEY,
+            cache_ttl: float = DEFAULT_CACHE_TTL
     ):
         self.base_url = base_url.rstrip("/")
         self.site_key = site_key
+        self.cache_ttl = cache_ttl
 
         self.session = requests.Session()
         self.session.headers.update({
@@ -687,57 +747,99 @@ class KaalitionClient:
             "Connection": "keep-alive",
             "X-Requested-With": "XMLHttpRequest",
             "X-Site-Key": site_key,
+            "Origin": self.base_url,
+            "Referer": f"{self.base_url}/",
         })
 
+        # Общий для всех клиентов пул keep-alive соединений
+        self.session.mount("https://", _ADAPTER)
+        self.session.mount("http://", _ADAPTER)
+
         self._projects_url = f"{self.base_url}/api/projects"
         self._members_url = f"{self.base_url}/api/members"
         self._news_url = f"{self.base_url}/api/news"
 
+        # Кэш публичных списков: url -> (время загрузки, разобранный JSON)
+        self._cache: Dict[str, Tuple[float, list]] = {}
+
+    def _worker_session(self) -> requests.Session:
+        """Отдельная сессия для рабочего потока (requests.Session не потокобезопасна).
+
+        Заголовки и cookies копируются из self.session, пул соединений общий.
+        """
+        session = requests.Session()
+        session.headers = self.session.headers.copy()
+        session.cookies.update(self.session.cookies)
+        session.mount("https://", _ADAPTER)
+        session.mount("http://", _ADAPTER)
+        return session
+
     def _get_headers(self, token: Optional[str] = None) -> Dict[str, str]:
-        headers = {
-            "Origin": self.base_url,
-            "Referer": f"{self.base_url}/",
-            "X-Site-Key": self.site_key
-        }
+        # Общие заголовки уже лежат в self.session.headers
         if token:
-            headers["Authorization"] = f"Bearer {token}"
-        return headers
+            return {"Authorization": f"Bearer {token}"}
+        return {}
 
     def _get_error_message(self, response: requests.Response) -> str:
         try:
-            return response.json().get("message", str(response.json()))
-        except:
-            return response.text[:200] if response.text else "Unknown error"
+            data = _json(response)
+        except requests.exceptions.RequestException:
+            data = None
+
+        if isinstance(data, dict) and data.get("message"):
+            return data["message"]
+        # Декодируем только начало тела, а не всю (возможно, большую) HTML-страницу;
+        # разрезанный на границе многобайтный символ отбрасывается
+        content = response.content[:200]
+        return content.decode("utf-8", "ignore") if content else "Unknown error"
+
+    def _get_list(self, url: str, cls, session: Optional[requests.Session] = None) -> list:
+        """Загружает список объектов cls с публичного эндпоинта (с кэшем на cache_ttl секунд)."""
+        # Кэшируется разобранный JSON: объекты собираются заново, чтобы вызовы не делили изменяемые экземпляры
+        cached = self._cache.get(url)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(map(cls.from_dict, cached[1]))
 
-    def get_projects(self) -> List[Project]:
-        """Получает список проектов."""
         try:
-            response = self.session.get(self._projects_url, headers=self._get_headers(), timeout=10)
+            response = (session or self.session).get(url, timeout=10)
             if response.ok:
-                return [Project.from_dict(p) for p in response.json()] if isinstance(response.json(), list) else []
+                data = _json(response)
+                if isinstance(data, list):
+                    self._cache[url] = (time.monotonic(), data)
+                    return list(map(cls.from_dict, data))
         except requests.exceptions.RequestException:
             pass
         return []
 
+    def clear_cache(self):
+        """Сбрасывает кэш публичных списков."""
+        self._cache.clear()
+
+    def get_projects(self) -> List[Project]:
+        """Получает список проектов."""
+        return self._get_list(self._projects_url, Project)
+
     def get_members(self) -> List[Member]:
         """Получает список участников."""
-        try:
-            response = self.session.get(self._members_url, headers=self._get_headers(), timeout=10)
-            if response.ok:
-                return [Member.from_dict(m) for m in response.json()] if isinstance(response.json(), list) else []
-        except requests.exceptions.RequestException:
-            pass
-        return []
+        return self._get_list(self._members_url, Member)
 
     def get_news(self) -> List[News]:
         """Получает список новостей."""
-        try:
-            response = self.session.get(self._news_url, headers=self._get_headers(), timeout=10)
-            if response.ok:
-                return [News.from_dict(n) for n in response.json()] if isinstance(response.json(), list) else []
-        except requests.exceptions.RequestException:
-            pass
-        return []
+        return self._get_list(self._news_url, News)
+
+    def get_public_data(self) -> Tuple[List[Project], List[Member], List[News]]:
+        """Параллельно получает проекты, участников и новости."""
+        # У каждого запроса своя сессия: cookies общей сессии не меняются из нескольких потоков
+        sessions = [self._worker_session() for _ in range(3)]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            projects = executor.submit(self._get_list, self._projects_url, Project, sessions[0])
+            members = executor.submit(self._get_list, self._members_url, Member, sessions[1])
+            news = executor.submit(self._get_list, self._news_url, News, sessions[2])
+            result = projects.result(), members.result(), news.result()
+
+        for session in sessions:
+            self.session.cookies.update(session.cookies)
+        return result
 
 
 # ============================================================================
@@ -753,13 +855,15 @@ class Account(KaalitionClient):
             email: str = "",
             password: str = "",
             base_url: str = DEFAULT_BASE_URL,
-            site_key: str = DEFAULT_SITE_KEY
+            site_key: str = DEFAULT_SITE_KEY,
+            cache_ttl: float = DEFAULT_CACHE_TTL
     ):
-        KaalitionClient.__init__(self, base_url=base_url, site_key=site_key)
+        KaalitionClient.__init__(self, base_url=base_url, site_key=site_key, cache_ttl=cache_ttl)
 
         # URLs
         self._login_url = f"{self.base_url}/api/auth/login"
         self._me_url = f"{self.base_url}/api/auth/me"
+        self._logout_url = f"{self.base_url}/api/auth/logout"
         self._profile_url = f"{self.base_url}/api/user/profile"
         self._password_url = f"{self.base_url}/api/user/password"
         self._theme_url = f"{self.base_url}/api/user/theme"
@@ -795,6 +899,7 @@ class Account(KaalitionClient):
         self.theme: str = "dark"
 
         # Поля авторизации
+        self._me_etag: Optional[str] = None
         self.token = token
         self.password = password
         self.active = True
@@ -807,16 +912,28 @@ class Account(KaalitionClient):
         elif token:
             self._do_create_from_token(token)
 
+    @property
+    def token(self) -> str:
+        """Токен авторизации."""
+        return self._token
+
+    @token.setter
+    def token(self, value: str):
+        # Заголовок авторизации пересобирается только при смене токена
+        self._token = value
+        self._auth_headers = self._get_headers(value)
+        self._me_etag = None
+
     def _do_login(self, email: str, password: str) -> bool:
         """Выполняет вход."""
         payload = {"email": email, "password": password}
 
         try:
-            response = self.session.post(self._login_url, json=payload, headers=self._get_headers(), timeout=10)
+            response = self.session.post(self._login_url, json=payload, timeout=10)
             if not response.ok:
                 raise LoginError(f"Код {response.status_code}: {self._get_error_message(response)}")
 
-            resp_data = response.json()
+            resp_data = _json(response)
             token = resp_data.get("token") or resp_data.get("access_token")
             if not token:
                 raise LoginError("Токен не получен")
@@ -843,13 +960,14 @@ class Account(KaalitionClient):
             if not response.ok:
                 raise TokenError(f"Код {response.status_code}: {self._get_error_message(response)}")
 
-            user_data = response.json()
+            user_data = _json(response)
             if "id" not in user_data:
                 raise TokenError("ID пользователя не получен")
 
             self.token = token
             self.active = True
             self._update_from_user_data(user_data)
+            self._me_etag = response.headers.get("ETag")
 
             return True
 
@@ -858,12 +976,21 @@ class Account(KaalitionClient):
 
     def _fetch_user_data(self) -> bool:
         """Получает данные пользователя."""
+        headers = self._auth_headers
+        if self._me_etag:
+            headers = {**headers, "If-None-Match": self._me_etag}
+
         try:
-            response = self.session.get(self._me_url, headers=self._get_headers(self.token), timeout=10)
+            response = self.session.get(self._me_url, headers=headers, timeout=10)
+            if response.status_code == 304:
+                # Профиль не изменился с прошлой синхронизации
+                self.active = True
+                return True
             if response.ok:
-                user_data = response.json()
+                user_data = _json(response)
                 if "id" in user_data:
                     self._update_from_user_data(user_data)
+                    self._me_etag = response.headers.get("ETag")
                     self.active = True
                     return True
             self.active = False
@@ -897,6 +1024,23 @@ class Account(KaalitionClient):
             return False
         return self._fetch_user_data()
 
+    @staticmethod
+    def refresh_many(accounts: List["Account"], max_workers: int = 16) -> List[bool]:
+        """Параллельная синхронизация нескольких аккаунтов с сервером.
+
+        Args:
+            accounts: Аккаунты для проверки.
+            max_workers: Максимум одновременных запросов.
+
+        Returns:
+            Результаты refresh() в порядке accounts.
+        """
+        if not accounts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(accounts))) as executor:
+            return list(executor.map(lambda account: account.refresh(), accounts))
+
     def is_active(self) -> bool:
         """Проверка активности."""
         if not self.token:
@@ -929,6 +1073,11 @@ class Account(KaalitionClient):
         if not self.token:
             return False
 
+        # Ничего не меняется — запрос не нужен
+        requested = {"nickname": nickname, "username": username, "bio": bio, "avatar_emoji": avatar_emoji}
+        if all(value is None or value == getattr(self, name) for name, value in requested.items()):
+            return True
+
         data = {
             "nickname": nickname if nickname is not None else self.nickname,
             "username": username if username is not None else self.username,
@@ -938,10 +1087,10 @@ class Account(KaalitionClient):
         }
 
         try:
-            response = self.session.post(self._profile_url, data=data, headers=self._get_headers(self.token),
+            response = self.session.post(self._profile_url, data=data, headers=self._auth_headers,
                                          timeout=10)
             if response.ok:
-                resp_data = response.json()
+                resp_data = _json(response)
                 if "user" in resp_data:
                     self._update_from_user_data(resp_data["user"])
                 else:
@@ -969,7 +1118,7 @@ class Account(KaalitionClient):
         }
 
         try:
-            response = self.session.post(self._password_url, data=data, headers=self._get_headers(self.token),
+            response = self.session.post(self._password_url, data=data, headers=self._auth_headers,
                                          timeout=10)
             return response.ok
         except requests.exceptions.RequestException:
@@ -984,7 +1133,7 @@ class Account(KaalitionClient):
             response = self.session.put(
                 self._theme_url,
                 json={"theme": theme},
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
@@ -1019,9 +1168,9 @@ class Account(KaalitionClient):
             return False
 
         try:
-            response = self.session.put(self._privacy_url, json=data, headers=self._get_headers(self.token), timeout=10)
+            response = self.session.put(self._privacy_url, json=data, headers=self._auth_headers, timeout=10)
             if response.ok:
-                resp_data = response.json()
+                resp_data = _json(response)
                 self.profile_public = resp_data.get("profile_public", self.profile_public)
                 self.show_online = resp_data.get("show_online", self.show_online)
                 self.allow_messages = resp_data.get("allow_messages", self.allow_messages)
@@ -1039,9 +1188,9 @@ class Account(KaalitionClient):
             return []
 
         try:
-            response = self.session.get(self._sessions_url, headers=self._get_headers(self.token), timeout=10)
+            response = self.session.get(self._sessions_url, headers=self._auth_headers, timeout=10)
             if response.ok:
-                return response.json()
+                return _json(response)
         except requests.exceptions.RequestException:
             pass
         return []
@@ -1054,7 +1203,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.delete(
                 f"{self._sessions_url}/{session_id}",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1069,7 +1218,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.delete(
                 self._sessions_url,
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1083,8 +1232,8 @@ class Account(KaalitionClient):
 
         try:
             response = self.session.post(
-                f"{self.base_url}/api/auth/logout",
-                headers=self._get_headers(self.token),
+                self._logout_url,
+                headers=self._auth_headers,
                 timeout=10
             )
             # Даже если ответ не OK, считаем что logout выполнен
@@ -1105,13 +1254,14 @@ class Account(KaalitionClient):
 
         try:
             response = self.session.get(
-                f"{self._search_users_url}?query={query}",
-                headers=self._get_headers(self.token),
+                self._search_users_url,
+                params={"query": query},
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                users_data = response.json()
-                return [User.from_dict(u) for u in users_data] if isinstance(users_data, list) else []
+                users_data = _json(response)
+                return list(map(User.from_dict, users_data)) if isinstance(users_data, list) else []
         except requests.exceptions.RequestException:
             pass
         return []
@@ -1122,20 +1272,22 @@ class Account(KaalitionClient):
         """Отправка сообщения. receiver_id - ID получателя."""
         if not self.token:
             return None
+        return self._send_message(self.session, receiver_id, text)
 
+    def _send_message(self, session: requests.Session, receiver_id: int, text: str) -> Optional[Message]:
         payload = {"receiver_id": receiver_id, "message": text}
 
         try:
-            response = self.session.post(
+            response = session.post(
                 self._send_message_url,
                 json=payload,
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if not response.ok:
                 return None
 
-            resp_data = response.json()
+            resp_data = _json(response)
             sender = self._get_current_user_sender()
             receiver = User(
                 id=receiver_id,
@@ -1147,6 +1299,33 @@ class Account(KaalitionClient):
         except requests.exceptions.RequestException:
             return None
 
+    def broadcast(self, receiver_ids: List[int], text: str, max_workers: int = 10) -> List[Optional[Message]]:
+        """Параллельная отправка одного сообщения нескольким получателям.
+
+        Args:
+            receiver_ids: ID получателей.
+            text: Текст сообщения.
+            max_workers: Максимум одновременных запросов.
+
+        Returns:
+            Результаты send_message в порядке receiver_ids.
+        """
+        if not self.token or not receiver_ids:
+            return [None] * len(receiver_ids)
+
+        # У каждого запроса своя сессия: cookies общей сессии не меняются из нескольких потоков
+        sessions = [self._worker_session() for _ in receiver_ids]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(receiver_ids))) as executor:
+            results = list(executor.map(
+                lambda session, receiver_id: self._send_message(session, receiver_id, text),
+                sessions,
+                receiver_ids
+            ))
+
+        for session in sessions:
+            self.session.cookies.update(session.cookies)
+        return results
+
     def get_chat_history(self, user_id: int) -> List[Message]:
         """Получение истории чата. user_id - ID собеседника."""
         if not self.token:
@@ -1155,32 +1334,49 @@ class Account(KaalitionClient):
         try:
             response = self.session.get(
                 f"{self._chat_history_url}/{user_id}",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if not response.ok:
                 raise ChatHistoryError(f"Ошибка: {response.status_code}")
 
-            messages_data = response.json()
+            messages_data = _json(response)
             if not isinstance(messages_data, list):
                 return []
 
             current_user = self._get_current_user_sender()
             target_user = User(id=user_id, username="", nickname="")
 
+            # В истории обычно два отправителя — не создаём User на каждое сообщение.
+            # Кэшируются только пользователи, собранные из полного объекта "sender";
+            # для сообщений только с sender_id используются current_user и target_user.
+            senders: Dict[int, User] = {}
+
             messages = []
             for msg_data in messages_data:
-                sender_data = msg_data.get("sender", {})
-                sender = User.from_dict(sender_data) if sender_data else User(
-                    id=msg_data.get("sender_id", 0),
-                    username="",
-                    nickname=""
-                )
+                sender_data = msg_data.get("sender")
+                if sender_data:
+                    sender_id = sender_data.get("id", 0)
+                    sender = senders.get(sender_id)
+                    if sender is None:
+                        sender = senders[sender_id] = User.from_dict(sender_data)
+                else:
+                    sender_id = msg_data.get("sender_id", 0)
+                    if sender_id == self.id:
+                        sender = current_user
+                    elif sender_id == user_id:
+                        sender = target_user
+                    else:
+                        sender = User(
+                            id=sender_id,
+                            username="",
+                            nickname=""
+                        )
                 receiver = current_user if msg_data.get("receiver_id") == self.id else target_user
                 message = Message.from_dict(msg_data, sender=sender, receiver=receiver, account=self)
                 messages.append(message)
 
-            messages.sort(key=lambda m: m.created_at)
+            messages.sort(key=attrgetter("created_at"))
             return messages
 
         except requests.exceptions.RequestException as e:
@@ -1194,11 +1390,11 @@ class Account(KaalitionClient):
         try:
             response = self.session.get(
                 self._chats_url,
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                chats_data = response.json()
+                chats_data = _json(response)
                 return [Chat.from_dict(c) for c in chats_data] if isinstance(chats_data, list) else []
         except requests.exceptions.RequestException:
             pass
@@ -1213,20 +1409,20 @@ class Account(KaalitionClient):
             response = self.session.put(
                 f"{self._chat_history_url}/{message.id}/edit",
                 json={"message": new_text},
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if not response.ok:
                 return None
 
-            resp_data = response.json()
+            resp_data = _json(response)
             message.text = resp_data.get("message", new_text)
             message.edited_at = resp_data.get("edited_at", message.edited_at)
             message.updated_at = resp_data.get("updated_at", message.updated_at)
 
             reactions_data = resp_data.get("reactions", [])
             if isinstance(reactions_data, list):
-                message.reactions = [Reaction.from_dict(r) for r in reactions_data]
+                message.reactions = list(map(Reaction.from_dict, reactions_data))
 
             return message
 
@@ -1241,7 +1437,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.delete(
                 f"{self._chat_history_url}/{message.id}",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1258,13 +1454,13 @@ class Account(KaalitionClient):
             response = self.session.post(
                 f"{self._chat_history_url}/{message.id}/react",
                 json={"emoji": emoji},
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                reactions_data = response.json().get("reactions", [])
+                reactions_data = _json(response).get("reactions", [])
                 if isinstance(reactions_data, list):
-                    message.reactions = [Reaction.from_dict(r) for r in reactions_data]
+                    message.reactions = list(map(Reaction.from_dict, reactions_data))
             return message.reactions
 
         except requests.exceptions.RequestException:
@@ -1286,16 +1482,16 @@ class Account(KaalitionClient):
 
         while True:
             try:
-                url = f"{self._channels_url}?page={current_page}"
                 response = self.session.get(
-                    url,
-                    headers=self._get_headers(self.token),
+                    self._channels_url,
+                    params={"page": current_page},
+                    headers=self._auth_headers,
                     timeout=10
                 )
                 if not response.ok:
                     break
 
-                resp_data = response.json()
+                resp_data = _json(response)
 
                 # Извлекаем массив каналов
                 if isinstance(resp_data, dict):
@@ -1340,11 +1536,11 @@ class Account(KaalitionClient):
         try:
             response = self.session.get(
                 f"{self._channels_url}/{channel_id}",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                return Channel.from_dict(response.json())
+                return Channel.from_dict(_json(response))
         except requests.exceptions.RequestException:
             pass
         return None
@@ -1374,7 +1570,7 @@ class Account(KaalitionClient):
             response = self.session.post(
                 self._channels_url,
                 json=data,
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
 
@@ -1384,7 +1580,7 @@ class Account(KaalitionClient):
                 print(f"  [DEBUG] Ответ: {response.text[:200]}")
                 return None
 
-            return Channel.from_dict(response.json())
+            return Channel.from_dict(_json(response))
         except requests.exceptions.RequestException as e:
             print(f"  [DEBUG] Исключение: {e}")
             return None
@@ -1430,7 +1626,7 @@ class Account(KaalitionClient):
             response = self.session.put(
                 f"{self._channels_url}/{channel_id}",
                 json=data,
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1445,7 +1641,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.delete(
                 f"{self._channels_url}/{channel_id}",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1460,7 +1656,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.post(
                 f"{self._channels_url}/{channel_id}/join",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1475,7 +1671,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.post(
                 f"{self._channels_url}/{channel_id}/leave",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1492,11 +1688,11 @@ class Account(KaalitionClient):
         try:
             response = self.session.get(
                 f"{self._channels_url}/{channel_id}/messages",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                messages_data = response.json()
+                messages_data = _json(response)
                 return [ChannelMessage.from_dict(m, channel_id, self) for m in messages_data] if isinstance(
                     messages_data, list) else []
         except requests.exceptions.RequestException:
@@ -1512,11 +1708,11 @@ class Account(KaalitionClient):
             response = self.session.post(
                 f"{self._channels_url}/{channel_id}/messages",
                 json={"message": text},
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                return ChannelMessage.from_dict(response.json(), channel_id, self)
+                return ChannelMessage.from_dict(_json(response), channel_id, self)
         except requests.exceptions.RequestException:
             pass
         return None
@@ -1530,11 +1726,11 @@ class Account(KaalitionClient):
             response = self.session.put(
                 f"{self._channels_url}/{channel_id}/messages/{message_id}",
                 json={"message": new_text},
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                return ChannelMessage.from_dict(response.json(), channel_id, self)
+                return ChannelMessage.from_dict(_json(response), channel_id, self)
         except requests.exceptions.RequestException:
             pass
         return None
@@ -1547,7 +1743,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.delete(
                 f"{self._channels_url}/{channel_id}/messages/{message_id}",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1562,7 +1758,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.post(
                 f"{self._channels_url}/{channel_id}/messages/{message_id}/pin",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1578,13 +1774,13 @@ class Account(KaalitionClient):
             response = self.session.post(
                 f"{self._channels_url}/{channel_id}/messages/{message_id}/react",
                 json={"emoji": emoji},
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                reactions_data = response.json().get("reactions", [])
+                reactions_data = _json(response).get("reactions", [])
                 if isinstance(reactions_data, list):
-                    return [Reaction.from_dict(r) for r in reactions_data]
+                    return list(map(Reaction.from_dict, reactions_data))
         except requests.exceptions.RequestException:
             pass
         return []
@@ -1597,11 +1793,11 @@ class Account(KaalitionClient):
         try:
             response = self.session.get(
                 f"{self._channels_url}/{channel_id}/messages/{message_id}/comments",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                comments_data = response.json()
+                comments_data = _json(response)
                 return [ChannelMessage.from_dict(c, channel_id, self) for c in comments_data] if isinstance(
                     comments_data, list) else []
         except requests.exceptions.RequestException:
@@ -1616,11 +1812,11 @@ class Account(KaalitionClient):
         try:
             response = self.session.get(
                 f"{self._channels_url}/{channel_id}/reactions",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                return response.json()
+                return _json(response)
         except requests.exceptions.RequestException:
             pass
         return {}
@@ -1635,11 +1831,11 @@ class Account(KaalitionClient):
         try:
             response = self.session.get(
                 f"{self._channels_url}/{channel_id}/members",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             if response.ok:
-                members_data = response.json()
+                members_data = _json(response)
                 return [ChannelMember.from_dict(m) for m in members_data] if isinstance(members_data, list) else []
         except requests.exceptions.RequestException:
             pass
@@ -1654,7 +1850,7 @@ class Account(KaalitionClient):
             response = self.session.put(
                 f"{self._channels_url}/{channel_id}/members/{user_id}/role",
                 json={"role": role},
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
@@ -1669,7 +1865,7 @@ class Account(KaalitionClient):
         try:
             response = self.session.delete(
                 f"{self._channels_url}/{channel_id}/members/{user_id}",
-                headers=self._get_headers(self.token),
+                headers=self._auth_headers,
                 timeout=10
             )
             return response.ok
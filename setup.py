@@ -28,8 +28,10 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.25.0",
-        "faker>=13.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0"],
+    },
     keywords="kaalition, api, automation, bot",
     project_urls={
         "Bug Reports": "https://github.com/Dima-programmer/KAALITION_API_LIB/issues",
@@ -0,0 +1,181 @@
+import unittest
+from unittest import mock
+
+from kaalition_lib import Account
+
+
+def _response(content: bytes, ok: bool = True, status_code: int = 200, headers=None) -> mock.Mock:
+    return mock.Mock(ok=ok, status_code=status_code, content=content, headers=headers or {})
+
+
+class ChatHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.account = Account()
+        self.account.token = "token"
+        self.account.id = 1
+
+    def _history(self, content: bytes):
+        with mock.patch.object(self.account.session, "get", return_value=_response(content)):
+            return self.account.get_chat_history(9)
+
+    def test_full_sender_not_shadowed_by_id_only_sender(self):
+        messages = self._history(
+            b'[{"id": 1, "sender_id": 9, "created_at": "1"},'
+            b' {"id": 2, "sender": {"id": 9, "username": "p"}, "created_at": "2"}]'
+        )
+        self.assertEqual(messages[0].sender.username, "")
+        self.assertEqual(messages[1].sender.username, "p")
+
+    def test_id_only_sender_does_not_reuse_full_sender(self):
+        messages = self._history(
+            b'[{"id": 1, "sender": {"id": 9, "username": "p"}, "created_at": "1"},'
+            b' {"id": 2, "sender_id": 9, "created_at": "2"}]'
+        )
+        self.assertEqual(messages[0].sender.username, "p")
+        self.assertEqual(messages[1].sender.username, "")
+
+    def test_full_senders_are_shared(self):
+        messages = self._history(
+            b'[{"id": 1, "sender": {"id": 9, "username": "p"}, "created_at": "1"},'
+            b' {"id": 2, "sender": {"id": 9, "username": "p"}, "created_at": "2"}]'
+        )
+        self.assertIs(messages[0].sender, messages[1].sender)
+
+    def test_id_only_partner_is_shared(self):
+        messages = self._history(
+            b'[{"id": 1, "sender_id": 9, "receiver_id": 1, "created_at": "1"},'
+            b' {"id": 2, "sender_id": 1, "receiver_id": 9, "created_at": "2"},'
+            b' {"id": 3, "sender_id": 9, "receiver_id": 1, "created_at": "3"}]'
+        )
+        self.assertIs(messages[0].sender, messages[2].sender)
+        self.assertIs(messages[0].sender, messages[1].receiver)
+        self.assertEqual(messages[0].sender.id, 9)
+        self.assertEqual(messages[1].sender.id, 1)
+
+
+class RefreshTest(unittest.TestCase):
+
+    ME = b'{"id": 1, "username": "user", "nickname": "User", "bio": "about"}'
+
+    def setUp(self):
+        response = _response(self.ME, headers={"ETag": '"v1"'})
+        with mock.patch("requests.Session.get", return_value=response):
+            self.account = Account(token="token")
+
+    def test_token_login_stores_etag(self):
+        self.assertEqual(self.account._me_etag, '"v1"')
+
+    def test_password_login_stores_etag(self):
+        with mock.patch("requests.Session.post", return_value=_response(b'{"token": "token"}')), \
+                mock.patch("requests.Session.get", return_value=_response(self.ME, headers={"ETag": '"v1"'})):
+            account = Account(email="mail@test.com", password="pass")
+        self.assertEqual(account._me_etag, '"v1"')
+
+    def test_not_modified_keeps_profile(self):
+        self.account.active = False
+        with mock.patch.object(self.account.session, "get",
+                               return_value=_response(b"", ok=False, status_code=304)) as get:
+            self.assertTrue(self.account.refresh())
+        self.assertEqual(get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(get.call_args.kwargs["headers"]["Authorization"], "Bearer token")
+        self.assertTrue(self.account.active)
+        self.assertEqual((self.account.id, self.account.username, self.account.nickname, self.account.bio),
+                         (1, "user", "User", "about"))
+
+    def test_modified_profile_updates_etag(self):
+        response = _response(b'{"id": 1, "username": "renamed"}', headers={"ETag": '"v2"'})
+        with mock.patch.object(self.account.session, "get", return_value=response):
+            self.assertTrue(self.account.refresh())
+        self.assertEqual(self.account.username, "renamed")
+        self.assertEqual(self.account._me_etag, '"v2"')
+
+    def test_token_change_resets_etag(self):
+        self.account.token = "other"
+        with mock.patch.object(self.account.session, "get", return_value=_response(self.ME)) as get:
+            self.account.refresh()
+        self.assertNotIn("If-None-Match", get.call_args.kwargs["headers"])
+
+
+class UpdateProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.account = Account()
+        self.account.token = "token"
+        self.account.nickname = "User"
+        self.account.username = "user"
+        self.account.bio = "about"
+        self.account.avatar_emoji = None
+
+    def _update(self, **kwargs):
+        response = _response(b'{"user": {"nickname": "New"}}')
+        with mock.patch.object(self.account.session, "post", return_value=response) as post:
+            result = self.account.update_profile(**kwargs)
+        return result, post
+
+    def test_no_arguments_sends_nothing(self):
+        result, post = self._update()
+        self.assertTrue(result)
+        post.assert_not_called()
+
+    def test_unchanged_values_send_nothing(self):
+        result, post = self._update(nickname="User", username="user", bio="about")
+        self.assertTrue(result)
+        post.assert_not_called()
+
+    def test_changed_value_is_sent(self):
+        result, post = self._update(nickname="New", username="user")
+        self.assertTrue(result)
+        post.assert_called_once()
+        self.assertEqual(post.call_args.kwargs["data"]["nickname"], "New")
+        self.assertEqual(post.call_args.kwargs["data"]["bio"], "about")
+        self.assertEqual(self.account.nickname, "New")
+
+    def test_without_token(self):
+        self.account.token = ""
+        result, post = self._update(nickname="New")
+        self.assertFalse(result)
+        post.assert_not_called()
+
+
+class BroadcastTest(unittest.TestCase):
+
+    def setUp(self):
+        self.account = Account()
+        self.account.token = "token"
+
+    def _broadcast(self, receiver_ids):
+        def send(account, session, receiver_id, text):
+            self.assertIsNot(session, account.session)
+            return f"{receiver_id}:{text}"
+
+        with mock.patch.object(Account, "_send_message", autospec=True, side_effect=send) as send_message:
+            return self.account.broadcast(receiver_ids, "hi"), send_message
+
+    def test_results_in_receiver_order(self):
+        results, send_message = self._broadcast(list(range(30)))
+        self.assertEqual(results, [f"{receiver_id}:hi" for receiver_id in range(30)])
+        self.assertEqual(send_message.call_count, 30)
+
+    def test_empty_receivers(self):
+        results, send_message = self._broadcast([])
+        self.assertEqual(results, [])
+        send_message.assert_not_called()
+
+    def test_without_token(self):
+        self.account.token = ""
+        results, send_message = self._broadcast([1, 2])
+        self.assertEqual(results, [None, None])
+        send_message.assert_not_called()
+
+    def test_worker_session_copies_headers_and_cookies(self):
+        self.account.session.cookies.set("XSRF-TOKEN", "abc")
+        session = self.account._worker_session()
+        self.assertEqual(session.headers, self.account.session.headers)
+        self.assertEqual(session.cookies.get("XSRF-TOKEN"), "abc")
+        session.headers["X-Test"] = "1"
+        self.assertNotIn("X-Test", self.account.session.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
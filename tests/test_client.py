@@ -0,0 +1,152 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+import requests
+
+from kaalition_lib import Account, KaalitionClient
+from kaalition_lib.kaalition_lib import _ADAPTER
+
+
+def _response(content: bytes, ok: bool = True, status_code: int = 200) -> mock.Mock:
+    return mock.Mock(ok=ok, status_code=status_code, content=content, headers={})
+
+
+class PublicListCacheTest(unittest.TestCase):
+
+    def test_cache_hit_skips_request(self):
+        client = KaalitionClient()
+        with mock.patch.object(client.session, "get", return_value=_response(b'[{"id": 1}]')) as get:
+            client.get_projects()
+            client.get_projects()
+        self.assertEqual(get.call_count, 1)
+
+    def test_cache_hit_returns_new_objects(self):
+        client = KaalitionClient()
+        with mock.patch.object(client.session, "get", return_value=_response(b'[{"id": 1, "title": "a"}]')):
+            first = client.get_projects()
+            first[0].title = "changed"
+            second = client.get_projects()
+        self.assertIsNot(first[0], second[0])
+        self.assertEqual(second[0].title, "a")
+
+    def test_clear_cache(self):
+        client = KaalitionClient()
+        with mock.patch.object(client.session, "get", return_value=_response(b'[]')) as get:
+            client.get_news()
+            client.clear_cache()
+            client.get_news()
+        self.assertEqual(get.call_count, 2)
+
+    def test_account_forwards_cache_ttl(self):
+        account = Account(cache_ttl=0)
+        self.assertEqual(account.cache_ttl, 0)
+        with mock.patch.object(account.session, "get", return_value=_response(b'[]')) as get:
+            account.get_members()
+            account.get_members()
+        self.assertEqual(get.call_count, 2)
+
+
+class PublicDataTest(unittest.TestCase):
+
+    def test_each_list_uses_own_session(self):
+        client = KaalitionClient()
+        bodies = {
+            client._projects_url: b'[{"id": 1}]',
+            client._members_url: b'[{"id": 2}, {"id": 3}]',
+            client._news_url: b'[]',
+        }
+        sessions = []
+
+        def get(session, url, **kwargs):
+            sessions.append(session)
+            return _response(bodies[url])
+
+        with mock.patch.object(requests.Session, "get", autospec=True, side_effect=get):
+            projects, members, news = client.get_public_data()
+        self.assertEqual([project.id for project in projects], [1])
+        self.assertEqual([member.id for member in members], [2, 3])
+        self.assertEqual(news, [])
+        self.assertNotIn(client.session, sessions)
+        self.assertEqual(len(set(map(id, sessions))), 3)
+
+    def test_failed_list_is_empty(self):
+        client = KaalitionClient()
+        with mock.patch.object(requests.Session, "get", side_effect=requests.exceptions.ConnectionError):
+            self.assertEqual(client.get_public_data(), ([], [], []))
+
+
+class ErrorMessageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = KaalitionClient()
+
+    def test_message_field(self):
+        self.assertEqual(self.client._get_error_message(_response(b'{"message": "bad"}')), "bad")
+
+    def test_json_without_message_falls_back_to_body(self):
+        self.assertEqual(self.client._get_error_message(_response(b'null')), "null")
+        self.assertEqual(self.client._get_error_message(_response(b'{"message": ""}')), '{"message": ""}')
+
+    def test_non_json_body(self):
+        self.assertEqual(self.client._get_error_message(_response(b'<html>')), "<html>")
+        self.assertEqual(self.client._get_error_message(_response(b'')), "Unknown error")
+
+    def test_cyrillic_body_cut_on_character_boundary(self):
+        # После однобайтного "!" срез в 200 байт разрезает двухбайтную кириллическую букву
+        text = "!" + "Ошибка" * 25
+        message = self.client._get_error_message(_response(text.encode("utf-8")))
+        self.assertEqual(message, text[:100])
+        self.assertNotIn("\ufffd", message)
+
+
+class SharedPoolTest(unittest.TestCase):
+
+    def test_session_close_keeps_shared_pool(self):
+        first, second = KaalitionClient(), KaalitionClient()
+        pool = second.session.get_adapter("https://kaalition.ru").poolmanager.connection_from_url(
+            "https://kaalition.ru"
+        )
+        first.session.close()
+        # После очистки пула PoolManager создал бы новый ConnectionPool
+        self.assertIs(_ADAPTER.poolmanager.connection_from_url("https://kaalition.ru"), pool)
+
+
+class _UnavailableHandler(BaseHTTPRequestHandler):
+    requests_count = 0
+
+    def do_GET(self):
+        type(self).requests_count += 1
+        self.send_response(503)
+        self.send_header("Retry-After", "600")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class RetryAfterTest(unittest.TestCase):
+
+    def setUp(self):
+        _UnavailableHandler.requests_count = 0
+        self.server = HTTPServer(("127.0.0.1", 0), _UnavailableHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retry_after_is_not_honored(self):
+        client = KaalitionClient(base_url=f"http://127.0.0.1:{self.server.server_port}")
+        started = time.monotonic()
+        self.assertEqual(client.get_projects(), [])
+        self.assertLess(time.monotonic() - started, 5)
+        # Повторы при 503 остаются
+        self.assertEqual(_UnavailableHandler.requests_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()